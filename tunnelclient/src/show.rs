@@ -27,6 +27,8 @@ pub struct Show {
     run_flag: RunFlag,
     window: PistonWindow<Sdl2Window>,
     render_logger: RenderIssueLogger,
+    /// Set once the snapshot receiver has disconnected, to avoid reporting it every update.
+    snapshots_disconnected: bool,
 }
 
 impl Show {
@@ -119,6 +121,7 @@ impl Show {
             run_flag,
             window,
             render_logger: RenderIssueLogger::new(Duration::from_secs(1)),
+            snapshots_disconnected: false,
         })
     }
 
@@ -205,10 +208,14 @@ impl Show {
         // Update the state of the snapshot manager.
         let update_result = self.snapshot_manager.update();
         if let Err(e) = update_result {
-            let msg = match e {
-                SnapshotUpdateError::Disconnected => "disconnected",
-            };
-            println!("An error occurred during snapshot update: {:?}", msg);
+            // The receiver never reconnects; only log the first occurrence.
+            if !self.snapshots_disconnected {
+                let msg = match e {
+                    SnapshotUpdateError::Disconnected => "disconnected",
+                };
+                error!("An error occurred during snapshot update: {}.", msg);
+            }
+            self.snapshots_disconnected = true;
         }
         // Update the interpolation parameter on our time synchronization.
         self.timesync
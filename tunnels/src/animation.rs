@@ -68,7 +68,7 @@ impl Animation {
     }
 
     /// Return true if this animation has nonzero weight.
-    fn active(&self) -> bool {
+    pub fn active(&self) -> bool {
         self.weight > 0.0
     }
 
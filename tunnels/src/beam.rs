@@ -27,10 +27,11 @@ impl Beam {
         level: UnipolarFloat,
         mask: bool,
         external_clocks: &ClockBank,
-    ) -> Vec<ArcSegment> {
+        arcs: &mut Vec<ArcSegment>,
+    ) {
         match self {
-            Self::Tunnel(t) => t.render(level, mask, external_clocks),
-            Self::Look(l) => l.render(level, mask, external_clocks),
+            Self::Tunnel(t) => t.render(level, mask, external_clocks, arcs),
+            Self::Look(l) => l.render(level, mask, external_clocks, arcs),
         }
     }
 }
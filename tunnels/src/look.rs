@@ -24,19 +24,17 @@ impl Look {
 
     /// Draw all the Beams in this Look.
     ///
-    /// The individual subchannels are unpacked and returned as a single channel of
-    /// many arc segment commands.
+    /// The individual subchannels are unpacked and rendered into the provided
+    /// buffer as a single channel of many arc segment commands.
     pub fn render(
         &self,
         level: UnipolarFloat,
         mask: bool,
         external_clocks: &ClockBank,
-    ) -> Vec<ArcSegment> {
-        let mut arcs = Vec::new();
+        arcs: &mut Vec<ArcSegment>,
+    ) {
         for channel in &self.channels {
-            let mut rendered = channel.render(level, mask, external_clocks);
-            arcs.append(&mut rendered);
+            channel.render(level, mask, external_clocks, arcs);
         }
-        arcs
     }
 }
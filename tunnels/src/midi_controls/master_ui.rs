@@ -128,8 +128,7 @@ pub fn update_master_ui_control(sc: StateChange, manager: &mut Manager) {
         }
         Channel(c) => {
             let page = c.0 / PAGE_SIZE;
-            let channel_offset = page * PAGE_SIZE;
-            let midi_channel = (c.0 - channel_offset) as u8;
+            let midi_channel = (c.0 % PAGE_SIZE) as u8;
 
             // Send to the appropriate device based on page.
             // If this channel is on page 0, disable all channel buttons on APC20.
@@ -146,8 +145,7 @@ pub fn update_master_ui_control(sc: StateChange, manager: &mut Manager) {
         }
         BeamButton((addr, state)) => {
             let page = addr.col / BeamStore::COLS_PER_PAGE;
-            let col_offset = page * BeamStore::COLS_PER_PAGE;
-            let midi_channel = (addr.col - col_offset) as u8;
+            let midi_channel = (addr.col % BeamStore::COLS_PER_PAGE) as u8;
 
             use BeamButtonState::*;
             let e = event(
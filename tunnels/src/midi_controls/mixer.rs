@@ -71,8 +71,7 @@ pub fn update_mixer_control(sc: StateChange, manager: &mut Manager) {
     use ChannelStateChange::*;
 
     let page = sc.channel.0 / PAGE_SIZE;
-    let channel_offset = page * PAGE_SIZE;
-    let midi_channel = (sc.channel.0 - channel_offset) as u8;
+    let midi_channel = (sc.channel.0 % PAGE_SIZE) as u8;
 
     let mut send = |event| {
         // Send page 0 to the APC40, page 1 to APC20
@@ -1,8 +1,8 @@
 use crate::midi_controls::MIXER_CHANNELS_PER_PAGE;
 use crate::{beam::Beam, look::Look, tunnel::Tunnel};
 use crate::{clock_bank::ClockBank, master_ui::EmitStateChange as EmitShowStateChange};
-use serde::{Deserialize, Serialize};
-use std::{collections::HashSet, sync::Arc, time::Duration};
+use serde::{de, Deserialize, Deserializer, Serialize, Serializer};
+use std::{sync::Arc, time::Duration};
 use tunnels_lib::number::UnipolarFloat;
 use tunnels_lib::{ArcSegment, LayerCollection};
 use typed_index_derive::TypedIndex;
@@ -63,12 +63,22 @@ impl Mixer {
             video_outs.push(Vec::new());
         }
         for channel in &self.channels {
-            let rendered_beam = channel.render(UnipolarFloat::ONE, false, external_clocks);
+            // Don't render channels that aren't sent to any video output.
+            if channel.video_outs.is_empty() {
+                continue;
+            }
+            let mut rendered_beam = Vec::new();
+            channel.render(
+                UnipolarFloat::ONE,
+                false,
+                external_clocks,
+                &mut rendered_beam,
+            );
             if rendered_beam.len() == 0 {
                 continue;
             }
             let rendered_ptr = Arc::new(rendered_beam);
-            for video_chan in &channel.video_outs {
+            for video_chan in channel.video_outs.iter() {
                 video_outs[video_chan.0].push(rendered_ptr.clone());
             }
         }
@@ -164,12 +174,12 @@ pub struct Channel {
     pub level: UnipolarFloat,
     pub bump: bool,
     pub mask: bool,
-    pub video_outs: HashSet<VideoChannel>,
+    pub video_outs: VideoOuts,
 }
 
 impl Channel {
     fn new(beam: Beam) -> Self {
-        let mut video_outs = HashSet::new();
+        let mut video_outs = VideoOuts::default();
         video_outs.insert(VideoChannel(0));
         Self {
             beam,
@@ -185,13 +195,14 @@ impl Channel {
         self.beam.update_state(delta_t);
     }
 
-    /// Render the beam in this channel.
+    /// Render the beam in this channel into the provided buffer.
     pub fn render(
         &self,
         level_scale: UnipolarFloat,
         mask: bool,
         external_clocks: &ClockBank,
-    ) -> Vec<ArcSegment> {
+        arcs: &mut Vec<ArcSegment>,
+    ) {
         let mut level: UnipolarFloat = if self.bump {
             UnipolarFloat::ONE
         } else {
@@ -200,9 +211,10 @@ impl Channel {
         level = level * level_scale;
         // if this channel is off, don't render at all
         if level == 0. {
-            return Vec::new();
+            return;
         }
-        self.beam.render(level, self.mask || mask, external_clocks)
+        self.beam
+            .render(level, self.mask || mask, external_clocks, arcs)
     }
 }
 
@@ -223,6 +235,71 @@ impl Default for ChannelIdx {
 #[derive(Debug, Copy, Clone, Ord, PartialOrd, Eq, PartialEq, Hash, Serialize, Deserialize)]
 pub struct VideoChannel(pub usize);
 
+/// The set of virtual video channels that a mixer channel outputs to.
+///
+/// Stored as a bitmask rather than a heap-allocated set since channels are
+/// cloned into every look and every rendered frame.  Serialized as a sequence
+/// of video channels, the same as the set it replaces.
+/// Only valid for video channels less than Mixer::N_VIDEO_CHANNELS.
+#[derive(Copy, Clone, Debug, Default, PartialEq, Eq)]
+pub struct VideoOuts(u8);
+
+// Every video channel must have a bit in the mask.
+const _: () = assert!(Mixer::N_VIDEO_CHANNELS <= u8::BITS as usize);
+
+impl VideoOuts {
+    pub fn contains(&self, vc: &VideoChannel) -> bool {
+        self.0 & (1 << vc.0) != 0
+    }
+
+    pub fn insert(&mut self, vc: VideoChannel) {
+        self.0 |= 1 << vc.0;
+    }
+
+    pub fn remove(&mut self, vc: &VideoChannel) {
+        self.0 &= !(1 << vc.0);
+    }
+
+    pub fn clear(&mut self) {
+        self.0 = 0;
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.0 == 0
+    }
+
+    /// Iterate over the video channels in this set, in ascending order.
+    pub fn iter(&self) -> impl Iterator<Item = VideoChannel> {
+        let outs = *self;
+        (0..Mixer::N_VIDEO_CHANNELS)
+            .map(VideoChannel)
+            .filter(move |vc| outs.contains(vc))
+    }
+}
+
+impl Serialize for VideoOuts {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.collect_seq(self.iter())
+    }
+}
+
+impl<'de> Deserialize<'de> for VideoOuts {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        let mut video_outs = Self::default();
+        for vc in Vec::<VideoChannel>::deserialize(deserializer)? {
+            if vc.0 >= Mixer::N_VIDEO_CHANNELS {
+                return Err(de::Error::custom(format!(
+                    "video channel {} out of range; max is {}",
+                    vc.0,
+                    Mixer::N_VIDEO_CHANNELS - 1
+                )));
+            }
+            video_outs.insert(vc);
+        }
+        Ok(video_outs)
+    }
+}
+
 pub struct ControlMessage {
     pub channel: ChannelIdx,
     pub msg: ChannelControlMessage,
@@ -255,3 +332,32 @@ impl<T: EmitShowStateChange> EmitStateChange for T {
         self.emit(ShowStateChange::Mixer(sc))
     }
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+    use rmp_serde::{from_read_ref, to_vec};
+    use std::collections::HashSet;
+
+    /// Video outputs must remain compatible with shows saved as a set.
+    #[test]
+    fn test_video_outs_serialization() {
+        let set: HashSet<VideoChannel> = vec![VideoChannel(0), VideoChannel(3), VideoChannel(7)]
+            .into_iter()
+            .collect();
+        let outs: VideoOuts = from_read_ref(&to_vec(&set).unwrap()).unwrap();
+        assert_eq!(
+            vec![VideoChannel(0), VideoChannel(3), VideoChannel(7)],
+            outs.iter().collect::<Vec<_>>()
+        );
+
+        let round_trip: HashSet<VideoChannel> = from_read_ref(&to_vec(&outs).unwrap()).unwrap();
+        assert_eq!(set, round_trip);
+
+        // Out-of-range video channels must fail to load rather than alias.
+        let out_of_range: HashSet<VideoChannel> =
+            vec![VideoChannel(1), VideoChannel(8)].into_iter().collect();
+        let result: Result<VideoOuts, _> = from_read_ref(&to_vec(&out_of_range).unwrap());
+        assert!(result.is_err());
+    }
+}
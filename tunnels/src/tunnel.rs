@@ -2,7 +2,7 @@ use crate::{
     animation::{Animation, Target},
     clock_bank::ClockBank,
 };
-use crate::{master_ui::EmitStateChange as EmitShowStateChange, waveforms::sawtooth};
+use crate::{master_ui::EmitStateChange as EmitShowStateChange, waveforms::sawtooth_unsmoothed};
 use serde::{Deserialize, Serialize};
 use std::cmp::{max, min};
 use std::time::Duration;
@@ -125,13 +125,14 @@ impl Tunnel {
             (scale_speed(self.marquee_speed).val() * timestep_secs * 30.) * MARQUEE_SPEED_SCALE;
     }
 
-    /// Render the current state of the tunnel.
+    /// Render the current state of the tunnel, appending arcs to the provided buffer.
     pub fn render(
         &self,
         level_scale: UnipolarFloat,
         as_mask: bool,
         external_clocks: &ClockBank,
-    ) -> Vec<ArcSegment> {
+        arcs: &mut Vec<ArcSegment>,
+    ) {
         // for artistic reasons/convenience, eliminate odd numbers of segments above 40.
         let segs = if self.segs > 40 && self.segs % 2 != 0 {
             self.segs + 1
@@ -140,22 +141,39 @@ impl Tunnel {
         };
         let blacking = self.blacking_integer();
 
-        let mut arcs = Vec::new();
+        arcs.reserve(segs as usize);
 
         let marquee_interval = 1.0 / segs as f64;
 
-        // Iterate over each segment ID and skip the segments that are blacked.
-        for seg_num in 0..segs {
-            let should_draw_segment = if blacking > 0 {
-                (seg_num as i32) % blacking == 0
-            } else {
-                (seg_num as i32) % blacking != 0
-            };
-            if !should_draw_segment {
-                continue;
+        // Hoist everything that doesn't vary per-segment out of the segment loop.
+        // Note that the smoothed offsets are computed on every call to val().
+        let thickness = self.thickness.val();
+        let thickness_allowance = thickness * THICKNESS_SCALE / 2.;
+        let size = self.size.val();
+        let aspect_ratio = self.aspect_ratio.val();
+        let x_offset = self.x_offset.val();
+        let y_offset = self.y_offset.val();
+        let col_center = self.col_center.val();
+        let col_width = self.col_width.val();
+        let col_spread = (COLOR_SPREAD_SCALE * self.col_spread.val()).floor();
+        let col_sat = self.col_sat.val();
+
+        // Inactive animations contribute nothing, and some targets don't apply
+        // at the segment level; select the animations to evaluate just once.
+        let mut selected_anims: [Option<&Animation>; N_ANIM] = [None; N_ANIM];
+        let mut n_selected_anims = 0;
+        for anim in &self.anims {
+            if anim.active() && !matches!(anim.target, Target::Blacking | Target::Segments) {
+                selected_anims[n_selected_anims] = Some(anim);
+                n_selected_anims += 1;
             }
+        }
+        let anims = &selected_anims[..n_selected_anims];
 
-            let rel_angle = Phase::new(marquee_interval * seg_num as f64);
+        // Iterate over each segment ID that isn't blacked.
+        for seg_num in segments_to_draw(segs, blacking) {
+            let seg_angle = marquee_interval * seg_num as f64;
+            let rel_angle = Phase::new(seg_angle);
 
             let mut thickness_adjust = 0.;
             let mut size_adjust = 0.;
@@ -170,7 +188,7 @@ impl Tunnel {
             let mut marquee_angle_adjust = 0.;
             // accumulate animation adjustments based on targets
             use Target::*;
-            for anim in &self.anims {
+            for anim in anims.iter().flatten() {
                 let anim_value = anim.get_value(rel_angle, external_clocks);
 
                 match anim.target {
@@ -192,25 +210,21 @@ impl Tunnel {
             // the abs() is there to prevent negative width setting when using multiple animations.
             // TODO: consider if we should change this behavior to make thickness clamp at 0 instead
             // of bounce back via absolute value here.
-            let stroke_weight = (self.thickness.val() * (1. + thickness_adjust)).abs();
-            let thickness_allowance = self.thickness.val() * THICKNESS_SCALE / 2.;
+            let stroke_weight = (thickness * (1. + thickness_adjust)).abs();
 
             // geometry calculations
-            let x_center = self.x_offset.val() + x_adjust;
-            let y_center = self.y_offset.val() + y_adjust;
+            let x_center = x_offset + x_adjust;
+            let y_center = y_offset + y_adjust;
 
             // compute ellipse parameters
-            let radius_x = ((self.size.val()
-                * (MAX_ASPECT_RATIO * (self.aspect_ratio.val() + aspect_ratio_adjust))
+            let radius_x = ((size * (MAX_ASPECT_RATIO * (aspect_ratio + aspect_ratio_adjust))
                 - thickness_allowance)
                 + size_adjust)
                 .abs();
-            let radius_y = (self.size.val() - thickness_allowance + size_adjust).abs();
+            let radius_y = (size - thickness_allowance + size_adjust).abs();
 
             // The angle of this particular segment.
-            let start_angle: Phase = self.curr_marquee_angle
-                + marquee_interval * (seg_num as f64)
-                + marquee_angle_adjust;
+            let start_angle: Phase = self.curr_marquee_angle + seg_angle + marquee_angle_adjust;
 
             // this angle may exceed 1.0; this is important for correctly displaying
             // arcs that cross the angular origin.
@@ -235,20 +249,13 @@ impl Tunnel {
                 }
             } else {
                 let hue = Phase::new(
-                    (self.col_center.val() + col_center_adjust)
+                    (col_center + col_center_adjust)
                         + (0.5
-                            * (self.col_width.val() + col_width_adjust)
-                            * sawtooth(
-                                rel_angle
-                                    * ((COLOR_SPREAD_SCALE * self.col_spread.val()).floor()
-                                        + col_period_adjust),
-                                UnipolarFloat::ZERO,
-                                UnipolarFloat::ONE,
-                                false,
-                            )),
+                            * (col_width + col_width_adjust)
+                            * sawtooth_unsmoothed(rel_angle * (col_spread + col_period_adjust))),
                 );
 
-                let sat = UnipolarFloat::new(self.col_sat.val() + col_sat_adjust);
+                let sat = UnipolarFloat::new(col_sat + col_sat_adjust);
 
                 ArcSegment {
                     level: level_scale.val(),
@@ -267,7 +274,6 @@ impl Tunnel {
             };
             arcs.push(arc);
         }
-        arcs
     }
 
     /// Emit the current value of all controllable tunnel state.
@@ -348,6 +354,19 @@ impl Tunnel {
     }
 }
 
+/// Iterate over the IDs of the segments that should be drawn.
+///
+/// Positive blacking draws every nth segment; negative blacking removes every
+/// nth segment. Blacking must not be zero.
+fn segments_to_draw(segs: u8, blacking: i32) -> impl Iterator<Item = u8> {
+    let interval = blacking.abs() as u8;
+    // When drawing every nth segment, step directly over the drawn segments.
+    let step = if blacking > 0 { interval } else { 1 };
+    (0..segs)
+        .step_by(step as usize)
+        .filter(move |seg_num| blacking > 0 || seg_num % interval != 0)
+}
+
 /// Scale speeds with a quadratic curve.
 /// This provides more resolution for slower speeds.
 fn scale_speed(speed: BipolarFloat) -> BipolarFloat {
@@ -415,3 +434,27 @@ impl<T: EmitShowStateChange> EmitStateChange for T {
         self.emit(ShowStateChange::Tunnel(sc))
     }
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn test_segments_to_draw() {
+        for &segs in &[1, 2, 17, 126, 128] {
+            for blacking in (-16..=16).filter(|b| *b != 0) {
+                let expected: Vec<u8> = (0..segs)
+                    .filter(|seg_num| {
+                        if blacking > 0 {
+                            (*seg_num as i32) % blacking == 0
+                        } else {
+                            (*seg_num as i32) % blacking != 0
+                        }
+                    })
+                    .collect();
+                let actual: Vec<u8> = segments_to_draw(segs, blacking).collect();
+                assert_eq!(expected, actual, "segs: {}, blacking: {}", segs, blacking);
+            }
+        }
+    }
+}
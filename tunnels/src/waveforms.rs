@@ -124,6 +124,19 @@ pub fn sawtooth(
     }
 }
 
+/// Sawtooth with no smoothing, full duty cycle, and no pulse.
+///
+/// Equivalent to sawtooth(phase, 0, 1, false), minus the general-case checks.
+/// Used in the per-segment tunnel color calculation.
+#[inline(always)]
+pub fn sawtooth_unsmoothed(phase: Phase) -> f64 {
+    if phase < 0.5 {
+        2.0 * phase.val()
+    } else {
+        2.0 * (phase.val() - 1.0)
+    }
+}
+
 #[cfg(test)]
 #[allow(unused)]
 mod test {
@@ -131,6 +144,13 @@ mod test {
 
     use super::*;
 
+    #[test]
+    fn test_sawtooth_unsmoothed() {
+        for (angle, expected) in generate_span(sawtooth, 0.0, 1.0, false) {
+            assert_eq!(expected, sawtooth_unsmoothed(Phase::new(angle)));
+        }
+    }
+
     fn debug() -> Result<(), Box<dyn Error>> {
         use plotters::prelude::*;
         let points = generate_span(sawtooth, 0.1, 0.5, true);